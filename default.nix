@@ -19,6 +19,8 @@
 #  > "scikit-learn",
 #  > "matplotlib",
 #  > "seaborn",
+#  > "numba",
+#  > "pyarrow",
 #  > "pytest"),
 #  > git_pkgs = list(list(package_name = "ryxpress",
 #  > repo_url = "https://github.com/b-rodrigues/ryxpress",
@@ -96,8 +98,10 @@ let
       pip
       ipykernel
       matplotlib
+      numba
       numpy
       pandas
+      pyarrow
       pytest
       scikit-learn
       seaborn;
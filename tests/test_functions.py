@@ -8,8 +8,11 @@ import matplotlib
 matplotlib.use("Agg")
 
 from functions import (
+    _maclaurin_decision_or_none,
     write_to_csv,
     copy_file,
+    save_model,
+    load_model,
     make_target_dist_png,
     make_correlation_heatmap_png,
     encode_categoricals,
@@ -87,6 +90,35 @@ def test_write_to_csv_no_dirpath_does_not_crash(tmp_path, monkeypatch):
     assert returned == "file.csv"
     assert (tmp_path / "file.csv").exists()
 
+def test_write_to_csv_writes_feather_sidecar(tmp_path):
+    """
+    With pyarrow available, an uncompressed Feather sidecar is written
+    next to the CSV and round-trips the frame exactly.
+    """
+    pytest.importorskip("pyarrow")
+    from pyarrow import feather
+
+    df = pd.DataFrame({"a": [1, 2], "b": [3.5, 4.5]})
+    out = tmp_path / "out.csv"
+
+    write_to_csv(df, str(out))
+
+    sidecar = tmp_path / "out.csv.feather"
+    assert sidecar.exists()
+    loaded = feather.read_feather(str(sidecar))
+    pd.testing.assert_frame_equal(loaded, df)
+
+def test_write_to_csv_feather_sidecar_can_be_disabled(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"a": [1, 2]})
+    out = tmp_path / "out.csv"
+
+    write_to_csv(df, str(out), also_feather=False)
+
+    assert out.exists()
+    assert not (tmp_path / "out.csv.feather").exists()
+
 def test_copy_file_happy_path(tmp_path):
     src = tmp_path / "src.bin"
     dst = tmp_path / "dst.bin"
@@ -103,6 +135,43 @@ def test_copy_file_bad_input_missing_source(tmp_path):
     with pytest.raises(FileNotFoundError):
         copy_file("does_not_exist.bin", str(dst))
 
+def test_copy_file_missing_source_keeps_existing_destination(tmp_path):
+    """
+    Bad input must not be destructive: a failed copy over an existing
+    artifact has to leave the artifact untouched.
+    """
+    dst = tmp_path / "dst.bin"
+    dst.write_bytes(b"keep me")
+
+    with pytest.raises(FileNotFoundError):
+        copy_file(str(tmp_path / "missing.bin"), str(dst))
+
+    assert dst.read_bytes() == b"keep me"
+
+def test_copy_file_same_path_is_a_no_op(tmp_path):
+    """
+    Edge case: source and destination are the same file (same inode).
+    The artifact is already in place and must survive.
+    """
+    src = tmp_path / "same.bin"
+    src.write_bytes(b"payload")
+
+    returned = copy_file(str(src), str(src))
+
+    assert returned == str(src)
+    assert src.read_bytes() == b"payload"
+
+def test_copy_file_overwrites_stale_destination(tmp_path):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"new")
+    dst.write_bytes(b"old artifact")
+
+    returned = copy_file(str(src), str(dst))
+
+    assert returned == str(dst)
+    assert dst.read_bytes() == b"new"
+
 
 # ============================================================
 # 2) Plot generator tests
@@ -162,6 +231,23 @@ def test_encode_categoricals_happy_path():
     assert out["cat"].dtype != object  # should be integer codes
     assert out["num"].dtype == df["num"].dtype
 
+def test_factorize_column_numba_matches_pandas():
+    """
+    numba-gated: the JIT factorizer itself (no fallback masking) must
+    assign the same first-seen codes as pd.factorize(..., sort=False).
+    """
+    pytest.importorskip("numba")
+    from functions import _factorize_column, _factorize_numba, _NumbaList
+
+    arr = pd.Series(["b", "a", "b", "c", "a", "c", "b"]).to_numpy()
+    expected = pd.factorize(arr, sort=False)[0]
+
+    # Direct JIT call: a broken numba invocation must fail loudly here,
+    # not hide behind the pandas fallback.
+    np.testing.assert_array_equal(_factorize_numba(_NumbaList(arr)), expected)
+    # And through the dispatching wrapper.
+    np.testing.assert_array_equal(_factorize_column(arr), expected)
+
 def test_make_processed_data_happy_path_shapes():
     df = make_encoded_df(n=40)
     proc = make_processed_data(df, target_col="target")
@@ -199,6 +285,55 @@ def test_train_predict_happy_path_and_accuracy_range():
     acc = compute_accuracy(proc, y_pred)
     assert 0.0 <= acc <= 1.0
 
+def test_predict_labels_maclaurin_path_matches_exact_small_gamma():
+    """
+    Small gamma on tightly clustered data: the Maclaurin error bound
+    accepts the expansion, and its labels must match libsvm's exact
+    predict.
+    """
+    from sklearn.svm import SVC
+
+    rng = np.random.default_rng(0)
+    X = (rng.normal(size=(200, 5)) * 0.05).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+    model = SVC(kernel="rbf", C=1.0, gamma=0.1).fit(X, y)
+
+    assert _maclaurin_decision_or_none(model, X) is not None
+
+    y_pred = predict_labels(model, {"X_test": X})
+    np.testing.assert_array_equal(y_pred, model.predict(X))
+
+def test_predict_labels_maclaurin_rejected_at_default_gamma():
+    """
+    The pipeline's own regime (gamma='scale' on standardized features)
+    is outside the expansion's validity: the error bound must reject it
+    and predict_labels must fall back to the exact decision function.
+    """
+    df = make_encoded_df(n=60)
+    proc = make_processed_data(df, target_col="target")
+    model = train_svm_rbf(proc, C=1.0)
+
+    assert _maclaurin_decision_or_none(model, proc["X_test"]) is None
+    np.testing.assert_array_equal(
+        predict_labels(model, proc), model.predict(proc["X_test"])
+    )
+
+def test_save_and_load_model_roundtrip(tmp_path):
+    df = make_encoded_df(n=60)
+    proc = make_processed_data(df, target_col="target")
+    model = train_svm_rbf(proc, C=1.0)
+
+    path = tmp_path / "model.joblib"
+    returned = save_model(model, str(path))
+
+    assert returned == str(path)
+    assert path.exists()
+
+    loaded = load_model(str(path))
+    np.testing.assert_array_equal(
+        predict_labels(loaded, proc), predict_labels(model, proc)
+    )
+
 def test_make_evaluation_df_schema_and_length():
     df = make_encoded_df(n=60)
     proc = make_processed_data(df, target_col="target")